@@ -0,0 +1,9 @@
+from django.contrib import admin
+from django.urls import path, include
+
+# Everything under /admin/. The SSO routes must come first: the admin urls
+# end with a catch-all pattern that would swallow 'sso/...'.
+urlpatterns = (
+    path("sso/", include("django_google_sso.urls", namespace="django_google_sso")),
+    path('', admin.site.urls),
+)
@@ -0,0 +1,18 @@
+# Generated by `python manage.py dump_router_urls` from Employee.api.router.
+# Do not edit; rerun the command whenever viewsets or registrations change.
+
+from django.urls import path, re_path
+from rest_framework.urlpatterns import format_suffix_patterns
+from rest_framework.routers import APIRootView
+from Employee.api.viewsets import Userviewsets
+
+format_suffix_patterns([])  # registers the <drf_format_suffix:...> converter
+
+urlpatterns = (
+    re_path('^users/$', Userviewsets.as_view({'get': 'list', 'post': 'create'}, **{'suffix': 'List', 'basename': 'user', 'detail': False}), name='user-list'),
+    re_path('^users\\.(?P<format>[a-z0-9]+)/?$', Userviewsets.as_view({'get': 'list', 'post': 'create'}, **{'suffix': 'List', 'basename': 'user', 'detail': False}), name='user-list'),
+    re_path('^users/(?P<pk>[^/.]+)/$', Userviewsets.as_view({'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'}, **{'suffix': 'Instance', 'basename': 'user', 'detail': True}), name='user-detail'),
+    re_path('^users/(?P<pk>[^/.]+)\\.(?P<format>[a-z0-9]+)/?$', Userviewsets.as_view({'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'}, **{'suffix': 'Instance', 'basename': 'user', 'detail': True}), name='user-detail'),
+    path('', APIRootView.as_view(**{'api_root_dict': {'users': 'user-list'}}), name='api-root'),
+    path('<drf_format_suffix:format>', APIRootView.as_view(**{'api_root_dict': {'users': 'user-list'}}), name='api-root'),
+)
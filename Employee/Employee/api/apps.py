@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class ApiConfig(AppConfig):
+    name = 'Employee.api'
+    label = 'api'
+
+    def ready(self):
+        from . import signals  # noqa: F401 - connects the token cache receivers
@@ -0,0 +1,58 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+TOKEN_CACHE_TIMEOUT = 300  # seconds
+
+# The only User fields kept in the cache: what the auth checks and the views
+# read. Anything else (password hash, email, ...) stays in Postgres and is
+# loaded on first access like any deferred field.
+CACHED_USER_FIELDS = ('id', 'username', 'is_active', 'is_staff', 'is_superuser')
+
+
+def token_cache_key(key):
+    return f'tok:{key}'
+
+
+def token_user_cache_key(user_id):
+    return f'tok:user:{user_id}'
+
+
+def get_token(key):
+    # Token (with its user) for key, served from the cache when possible.
+    # Raises Token.DoesNotExist like Token.objects.get() would.
+    # The cache maps the key to its user's id and the id to CACHED_USER_FIELDS,
+    # so a User change only has to drop one entry (see signals.py).
+    user_id = cache.get(token_cache_key(key))
+    values = None if user_id is None else cache.get(token_user_cache_key(user_id))
+    if values is None:
+        token = Token.objects.select_related('user').get(key=key)
+        cache.set_many({
+            token_cache_key(key): token.user_id,
+            token_user_cache_key(token.user_id): {name: getattr(token.user, name) for name in CACHED_USER_FIELDS},
+        }, TOKEN_CACHE_TIMEOUT)
+        return token
+    # from_db() wants the values in model field order
+    names = [field.attname for field in User._meta.concrete_fields if field.attname in values]
+    token = Token.from_db(None, ['key', 'user_id'], [key, user_id])
+    token.user = User.from_db(None, names, [values[name] for name in names])
+    return token
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    # Same checks as TokenAuthentication, but the token/user lookup goes
+    # through the cache instead of hitting Postgres on every API request.
+
+    def authenticate_credentials(self, key):
+        try:
+            token = get_token(key)
+        except Token.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        return (token.user, token)
@@ -0,0 +1,76 @@
+import ast
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.urls.resolvers import RoutePattern
+
+from Employee.api.router import router_urls
+
+FROZEN_PATH = Path(__file__).resolve().parents[2] / '_router_urls_frozen.py'
+
+HEADER = '''\
+# Generated by `python manage.py dump_router_urls` from Employee.api.router.
+# Do not edit; rerun the command whenever viewsets or registrations change.
+'''
+
+
+def _literal(value):
+    # repr() that is guaranteed to read back as the same value
+    text = repr(value)
+    try:
+        if ast.literal_eval(text) == value:
+            return text
+    except (ValueError, SyntaxError):
+        pass
+    raise CommandError('Cannot freeze %r, it is not a Python literal.' % (value,))
+
+
+def render_router_urls(urls):
+    imports = {}
+    lines = []
+    needs_format_converter = False
+    for url in urls:
+        callback = url.callback
+        cls = callback.cls
+        if imports.setdefault(cls.__name__, cls.__module__) != cls.__module__:
+            raise CommandError('Two views named %s, cannot freeze.' % cls.__name__)
+        args = [_literal(callback.actions)] if hasattr(callback, 'actions') else []
+        args += ['**' + _literal(callback.initkwargs)] if callback.initkwargs else []
+        view = '%s.as_view(%s)' % (cls.__name__, ', '.join(args))
+        if isinstance(url.pattern, RoutePattern):
+            route = str(url.pattern)
+            needs_format_converter |= '<drf_format_suffix:' in route
+            lines.append('    path(%s, %s, name=%s),' % (_literal(route), view, _literal(url.name)))
+        else:
+            regex = url.pattern.regex.pattern
+            lines.append('    re_path(%s, %s, name=%s),' % (_literal(regex), view, _literal(url.name)))
+
+    out = [HEADER, 'from django.urls import path, re_path']
+    if needs_format_converter:
+        out.append('from rest_framework.urlpatterns import format_suffix_patterns')
+    out += ['from %s import %s' % (module, name) for name, module in sorted(imports.items())]
+    out.append('')
+    if needs_format_converter:
+        out += ['format_suffix_patterns([])  # registers the <drf_format_suffix:...> converter', '']
+    out += ['urlpatterns = ('] + lines + [')', '']
+    return '\n'.join(out)
+
+
+class Command(BaseCommand):
+    help = 'Write the DRF router url patterns to Employee/api/_router_urls_frozen.py'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check', action='store_true',
+            help='Exit with an error if the frozen file is out of date (for CI).',
+        )
+
+    def handle(self, *args, **options):
+        source = render_router_urls(router_urls)
+        current = FROZEN_PATH.read_text() if FROZEN_PATH.exists() else None
+        if options['check']:
+            if current != source:
+                raise CommandError('%s is out of date, run dump_router_urls.' % FROZEN_PATH.name)
+            return
+        FROZEN_PATH.write_text(source)
+        self.stdout.write('Wrote %d url patterns to %s' % (len(router_urls), FROZEN_PATH))
@@ -2,4 +2,7 @@ from .viewsets import Userviewsets
 from rest_framework import routers
  
 router = routers.DefaultRouter()
-router.register('users', Userviewsets, basename='user')
\ No newline at end of file
+router.register('users', Userviewsets, basename='user')
+
+# Generated once here, after all registrations; urlconfs include this list
+router_urls = router.urls
@@ -0,0 +1,21 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import CACHED_USER_FIELDS, token_cache_key, token_user_cache_key
+
+
+@receiver([post_save, post_delete], sender=Token, dispatch_uid='api.token_cache_invalidate')
+def invalidate_token(sender, instance, **kwargs):
+    cache.delete(token_cache_key(instance.key))
+
+
+@receiver([post_save, post_delete], sender=User, dispatch_uid='api.user_token_cache_invalidate')
+def invalidate_token_user(sender, instance, update_fields=None, **kwargs):
+    # A save that doesn't touch the cached fields (e.g. a login updating
+    # last_login) leaves the entry alone.
+    if update_fields is not None and set(update_fields).isdisjoint(CACHED_USER_FIELDS):
+        return
+    cache.delete(token_user_cache_key(instance.pk))
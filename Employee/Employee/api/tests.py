@@ -0,0 +1,64 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework import exceptions
+from rest_framework.authtoken.models import Token
+
+from .authentication import CachedTokenAuthentication, token_cache_key, token_user_cache_key
+
+# Create your tests here.
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CachedTokenAuthenticationTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('bob', password='secret')
+        self.token = Token.objects.create(user=self.user)
+        self.auth = CachedTokenAuthentication()
+
+    def authenticate(self):
+        return self.auth.authenticate_credentials(self.token.key)
+
+    def test_hit_runs_no_queries(self):
+        with self.assertNumQueries(1):
+            self.authenticate()
+        with self.assertNumQueries(0):
+            user, token = self.authenticate()
+        self.assertEqual((user.pk, user.username, token.key), (self.user.pk, 'bob', self.token.key))
+
+    def test_cache_holds_no_password_hash(self):
+        self.authenticate()
+        self.assertNotIn(self.user.password, repr(cache.get(token_user_cache_key(self.user.pk))))
+
+    def test_token_delete_clears_entry(self):
+        self.authenticate()
+        self.token.delete()
+        self.assertIsNone(cache.get(token_cache_key(self.token.key)))
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.authenticate()
+
+    def test_token_save_clears_entry(self):
+        self.authenticate()
+        self.token.save()
+        self.assertIsNone(cache.get(token_cache_key(self.token.key)))
+
+    def test_user_save_clears_entry(self):
+        self.authenticate()
+        self.user.is_active = False
+        self.user.save()
+        self.assertIsNone(cache.get(token_user_cache_key(self.user.pk)))
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.authenticate()
+
+    def test_user_delete_clears_entries(self):
+        self.authenticate()
+        self.user.delete()
+        self.assertIsNone(cache.get(token_cache_key(self.token.key)))
+        self.assertIsNone(cache.get(token_user_cache_key(self.user.pk)))
+
+    def test_last_login_save_keeps_entry(self):
+        self.authenticate()
+        self.user.save(update_fields=['last_login'])
+        self.assertIsNotNone(cache.get(token_user_cache_key(self.user.pk)))
@@ -0,0 +1,20 @@
+from django.urls import path, include
+from rest_framework.authtoken import views as auth_views
+from rest_framework_simplejwt import views as jwt_views
+from .url_fastpath import lpath
+from .views import verify_token
+
+# Everything under /api/ - non-API requests skip this subtree after one prefix test
+urlpatterns = (
+    path('', include('Employee.api._router_urls_frozen')),  # Includes /api/users/ endpoint (frozen by dump_router_urls)
+    ######################## Token ###########################
+    lpath('token-auth/', auth_views.obtain_auth_token, name='api-token-auth'),  # Token generation endpoint
+    lpath('verify-token/', verify_token, name='verify_token'),
+    ######################## JWT Token #######################
+    path('token/', 
+         jwt_views.TokenObtainPairView.as_view(), 
+         name ='token_obtain_pair'), 
+    path('token/refresh/',
+         jwt_views.TokenRefreshView.as_view(), 
+         name ='token_refresh'),
+)
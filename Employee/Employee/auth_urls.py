@@ -0,0 +1,10 @@
+from django.contrib.auth import views as auth_views
+from .url_fastpath import lpath
+
+# The subset of django.contrib.auth.urls this project uses (the accounts
+# templates only link to login and logout). Both routes are literals, so
+# they are matched by string comparison.
+urlpatterns = (
+    lpath('login/', auth_views.LoginView.as_view(), name='login'),
+    lpath('logout/', auth_views.LogoutView.as_view(), name='logout'),
+)
@@ -43,12 +43,13 @@ INSTALLED_APPS = [
     'accounts',
     'django_crontab',
     'rest_framework',
-    'rest_framework.authtoken'
+    'rest_framework.authtoken',
+    'Employee.api',
 ]
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-               'rest_framework.authentication.TokenAuthentication',
+               'Employee.api.authentication.CachedTokenAuthentication',
                'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES':(
@@ -56,6 +57,23 @@ REST_FRAMEWORK = {
     )
 }
 
+# Shared across worker processes (token lookups, see Employee/api/authentication.py)
+# Each process keeps a pool of Redis connections; extra OPTIONS go to the pool.
+# The blocking pool makes a request past max_connections wait up to timeout
+# seconds for a free connection instead of failing with "Too many connections".
+# Read several keys with cache.get_many() (one MGET) rather than get() per key.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': 'redis://127.0.0.1:6379/1',
+        'OPTIONS': {
+            'pool_class': 'redis.BlockingConnectionPool',
+            'max_connections': 50,
+            'timeout': 5,
+        },
+    }
+}
+
 CRONJOBS = [
 ('*/1 * * * *', 'myapp.task.test')
 ]
@@ -117,8 +135,13 @@ DATABASES = {
         'USER':'postgres',  
         'PASSWORD':'1234',  
         'HOST':'localhost',  
-        'PORT':'5432'  
+        'PORT':'5432',
 
+        # Reuse connections across requests instead of connecting per request,
+        # checking them before reuse after an error or restart of Postgres.
+        # Behind pgbouncer in transaction mode also set DISABLE_SERVER_SIDE_CURSORS.
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -161,6 +184,13 @@ USE_TZ = True
 
 STATIC_URL = '/static/'
 
+# Uploads always go to a temporary file, which myapp's upload view moves into
+# place instead of copying. The move is a rename when FILE_UPLOAD_TEMP_DIR is
+# on the same filesystem as the project.
+FILE_UPLOAD_HANDLERS = [
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/3.2/ref/settings/#default-auto-field
 
@@ -0,0 +1,87 @@
+from unittest import mock, skipIf
+
+from django.test import SimpleTestCase
+from django.urls import Resolver404, URLResolver, include, path, re_path
+from django.urls.resolvers import RegexPattern
+
+from . import url_fastpath
+from .url_fastpath import DispatchResolver, _HyperscanMatcher, _ReMatcher
+from .urls import patterns
+
+# Create your tests here.
+
+PATHS = [
+    '', '/', '/insert', '/show/', '/show', '/upload_files', '/read_csv', '/write_csv',
+    '/edit/3', '/edit/x', '/edit/', '/edit/3/', '/remove/4', '/remove/-1', '/remove/4x',
+    '/admin/', '/admin', '/admin/login/', '/admin/auth/user/', '/admin/auth/user/1/change/',
+    '/admin/auth/user/x/change/', '/admin/sso/login/', '/admin/sso/', '/admin/nope',
+    '/api/', '/api', '/api/.json', '/api/users/', '/api/users.json', '/api/users/5/',
+    '/api/users/5.json', '/api/users/5.api', '/api/users/5/x', '/api/users/a.b/',
+    '/api/token/', '/api/token/refresh/', '/api/token-auth/', '/api/token-auth',
+    '/api/verify-token/', '/api/verify-token',
+    '/accounts/login/', '/accounts/logout/', '/accounts/login', '/accounts/',
+    '/tutorial/hello', '/tutorial/hello/', '/tutorial/stream_view', '/tutorial/', '/tutorial',
+    '/nope', '/insert\n', '/show/\n', '/édit/3', '/edit/٣',
+]
+
+
+def _view(request, **kwargs):
+    pass
+
+
+def _other_view(request, **kwargs):
+    pass
+
+
+# Entries that overlap, so the first one that answers must win
+OVERLAPPING = (
+    path('a/<int:pk>', _view, name='int'),
+    path('a/<str:slug>', _other_view, name='str'),
+    path('a/1', _other_view, name='literal'),
+    path('b/', include([path('<int:pk>', _view, name='b-int')])),
+    re_path(r'^b/(?P<slug>\w+)$', _other_view, name='b-word'),
+    path('', include([path('c', _view, name='c'), path('<path:rest>', _other_view, name='rest')])),
+)
+OVERLAPPING_PATHS = ['/a/1', '/a/x', '/a/', '/b/1', '/b/x', '/b/', '/c', '/cc', '/', '']
+
+
+def _outcome(resolver, path):
+    try:
+        match = resolver.resolve(path)
+    except Resolver404:
+        return None
+    return (match.func, match.args, match.kwargs, match.url_name,
+            match.namespaces, match.app_names, match.route)
+
+
+class DispatchResolverTests(SimpleTestCase):
+    # The dispatch resolver must answer every path exactly like Django's
+    # linear scan over the same patterns, whichever matcher it ends up with.
+
+    def assertSameAsStock(self, urlpatterns, paths, matcher_class):
+        resolver = DispatchResolver(urlpatterns)
+        self.assertIsInstance(resolver._dispatch[0], matcher_class)
+        stock = URLResolver(RegexPattern(r'^/'), list(urlpatterns))
+        fast = URLResolver(RegexPattern(r'^/'), [resolver])
+        paths = paths + [path + suffix for path in paths for suffix in ('x', '/', '.json')]
+        for path in paths:
+            with self.subTest(path=path):
+                self.assertEqual(_outcome(fast, path), _outcome(stock, path))
+
+    def test_re_matcher(self):
+        with mock.patch.object(url_fastpath, 'hyperscan', None):
+            self.assertSameAsStock(patterns, PATHS, _ReMatcher)
+            self.assertSameAsStock(OVERLAPPING, OVERLAPPING_PATHS, _ReMatcher)
+
+    @skipIf(url_fastpath.hyperscan is None, 'hyperscan is not installed')
+    def test_hyperscan_matcher(self):
+        self.assertSameAsStock(patterns, PATHS, _HyperscanMatcher)
+        self.assertSameAsStock(OVERLAPPING, OVERLAPPING_PATHS, _HyperscanMatcher)
+
+    def test_rejections_and_suffixes(self):
+        # A converter rejection falls through to a 404, format suffixes resolve
+        resolver = DispatchResolver(patterns)
+        self.assertIsNone(_outcome(resolver, 'edit/x'))
+        self.assertIsNone(_outcome(resolver, 'nope'))
+        self.assertEqual(_outcome(resolver, 'edit/3')[2], {'pk': 3})
+        self.assertEqual(_outcome(resolver, 'api/users/5.json')[2], {'pk': '5', 'format': 'json'})
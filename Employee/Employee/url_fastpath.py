@@ -0,0 +1,176 @@
+import re
+import sys
+import threading
+from functools import lru_cache, partial
+
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import Resolver404, URLPattern, URLResolver, path
+from django.urls.resolvers import RoutePattern
+from django.utils.functional import cached_property
+
+try:
+    import hyperscan
+except ImportError:  # optional, the re-based matcher is used without it
+    hyperscan = None
+
+
+class LiteralPattern(RoutePattern):
+    # A route without <converters> matched by plain string comparison instead
+    # of a regex search. The regex is still built for reverse() and checks.
+    # The route is interned so identical routes in other urlconfs share one
+    # string object.
+
+    def __init__(self, route, name=None, is_endpoint=False):
+        if isinstance(route, str):
+            route = sys.intern(route)
+        super().__init__(route, name, is_endpoint)
+        if self.converters:
+            raise ImproperlyConfigured(
+                "lpath() route %r has converters, use path() instead." % route
+            )
+
+    def match(self, path):
+        if self._is_endpoint:
+            if path == self._route:
+                return '', (), {}
+        elif path.startswith(self._route):
+            return path[len(self._route):], (), {}
+        return None
+
+
+# path() with a LiteralPattern, e.g. lpath('verify-token', verify_token, name='verify_token')
+lpath = partial(path, Pattern=LiteralPattern)
+
+
+class DispatchResolver(URLResolver):
+    # Wraps a list of url patterns and matches the path against all of the
+    # entries' prefixes/endpoints at once (Hyperscan when installed, else one
+    # combined regex), which names the first entry that can answer it; only
+    # that entry is resolved. Django's linear scan remains the fallback.
+
+    def __init__(self, patterns):
+        super().__init__(RoutePattern(''), patterns)
+        # Build the matcher at import time instead of on the first request
+        self._dispatch
+        # Per-process cache of successful resolves (Resolver404 is not cached).
+        # The autoreloader restarts the process, which empties it in DEBUG.
+        self.resolve = lru_cache(maxsize=4096)(self._resolve)
+
+    @cached_property
+    def _dispatch(self):
+        # Returns (matcher or None, [single-entry resolver per alternative]).
+        regexes = []
+        targets = []
+        for pattern in self.url_patterns:
+            entry = URLResolver(RoutePattern(''), [pattern])
+            for regex in _flatten(pattern):
+                regexes.append(regex)
+                targets.append(entry)
+        return _build_matcher(regexes), targets
+
+    def _resolve(self, path):
+        path = str(path)
+        matcher, targets = self._dispatch
+        if matcher is not None:
+            index = matcher.first(path)
+            if index is not None:
+                try:
+                    return targets[index].resolve(path)
+                except Resolver404:
+                    # A converter rejected the value; a later entry may still match.
+                    pass
+        return super().resolve(path)
+
+
+class _ReMatcher:
+    # One regex made of all alternatives; the first one that matches wins,
+    # like Django's linear scan.
+
+    def __init__(self, regexes):
+        alternatives = []
+        for index, regex in enumerate(regexes):
+            group = 'r%d' % index
+            regex = _NAMED_GROUP_RE.sub(r'(?P\1%s_\2' % group, regex)
+            alternatives.append('(?P<%s>%s)' % (group, regex))
+        self._regex = re.compile('|'.join(alternatives))
+
+    def first(self, path):
+        match = self._regex.match(path)
+        if match:
+            return int(match.lastgroup[1:])
+        return None
+
+
+class _HyperscanMatcher:
+    # All alternatives in one Hyperscan database, scanned with a single C
+    # call. Each expression reports its position in the list as id, so the
+    # lowest id reported is the entry the linear scan would have picked.
+
+    _FLAGS = (
+        (hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_ALLOWEMPTY
+         | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+        if hyperscan is not None else 0
+    )
+
+    def __init__(self, regexes):
+        # Python's \Z is PCRE's \z (end of string, no trailing newline).
+        expressions = [('^' + regex.replace(r'\Z', r'\z')).encode() for regex in regexes]
+        self._database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        self._database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=[self._FLAGS] * len(expressions),
+        )
+        # Scratch space can't be shared between threads scanning at once
+        self._local = threading.local()
+
+    def first(self, path):
+        scratch = getattr(self._local, 'scratch', None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self._database)
+        try:
+            data = path.encode()
+        except UnicodeEncodeError:
+            return None
+        ids = []
+        self._database.scan(data, match_event_handler=_collect_id, context=ids, scratch=scratch)
+        return min(ids) if ids else None
+
+
+def _collect_id(id, start, end, flags, ids):
+    ids.append(id)
+
+
+def _build_matcher(regexes):
+    # Hyperscan if it is installed and accepts every alternative (no
+    # backreferences, lookarounds etc.), otherwise the stdlib re union.
+    # None leaves everything to the linear scan.
+    if not regexes:
+        return None
+    if hyperscan is not None:
+        try:
+            return _HyperscanMatcher(regexes)
+        except hyperscan.error:
+            pass
+    try:
+        return _ReMatcher(regexes)
+    except re.error:
+        return None
+
+
+_NAMED_GROUP_RE = re.compile(r'\(\?P([<=])(\w+)')
+
+
+def _flatten(pattern, prefix=''):
+    # Yields one regex per endpoint and per include() prefix below pattern,
+    # joined the same way URLResolver._populate joins them for reverse().
+    # An include() with a non-empty prefix is represented by that prefix
+    # alone: the whole entry is resolved anyway, so its subtree is pruned
+    # with one test.
+    regex = pattern.pattern.regex.pattern.removeprefix('^')
+    if isinstance(pattern, URLPattern) or regex:
+        yield prefix + regex
+    else:
+        for child in pattern.url_patterns:
+            yield from _flatten(child, prefix)
@@ -13,29 +13,24 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
-from django.contrib import admin
 from django.urls import path, include
-from .api.router import router
-from rest_framework.authtoken import views as auth_views
-from rest_framework_simplejwt import views as jwt_views
-from .views import verify_token
 from tutorial.views import HelloView
+from .url_fastpath import DispatchResolver
 
-urlpatterns = [
-    path('admin/', admin.site.urls),
+# Ordered by expected traffic: the resolver stops at the first match, so the
+# busy app/API routes go first and rarely hit admin/SSO/auth routes go last.
+# Keep this order when adding new entries.
+patterns = (
     path('', include('myapp.urls')),
-    path('tutorial', include('tutorial.urls')),
-    path("google_sso/", include("django_google_sso.urls", namespace="django_google_sso")),
-    path("accounts/", include("django.contrib.auth.urls")),  # new
-    ######################## Token ###########################
-    path('api/', include(router.urls)),  # Includes /api/users/ endpoint
-    path('api-token-auth/', auth_views.obtain_auth_token, name='api-token-auth'),  # Token generation endpoint
-    path('verify-token', verify_token, name='verify_token'),
-    ######################## JWT Token #######################
-    path('api/token/', 
-         jwt_views.TokenObtainPairView.as_view(), 
-         name ='token_obtain_pair'), 
-    path('api/token/refresh/',
-         jwt_views.TokenRefreshView.as_view(), 
-         name ='token_refresh')
-]
+    path('api/', include('Employee.api_urls')),  # Router, token, verify-token and JWT endpoints
+    path('tutorial/', include('tutorial.urls')),
+    ######################## Admin / Auth ####################
+    path('admin/', include('Employee.admin_tree_urls')),  # admin site and Google SSO
+    path("accounts/", include("Employee.auth_urls")),  # login/logout only
+)
+
+# Every request is matched against all routes at once (see url_fastpath), and
+# successful resolves are cached; Django's linear scan is only the fallback
+urlpatterns = (
+    DispatchResolver(patterns),
+)
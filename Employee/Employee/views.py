@@ -1,7 +1,9 @@
-from rest_framework.authtoken.models import Token
-from django.http import HttpResponse
+from rest_framework.decorators import api_view, authentication_classes
+from rest_framework.response import Response
+from .api.authentication import CachedTokenAuthentication
 
+# POST /api/verify-token/ with "Authorization: Token <key>"
+@api_view(['POST'])
+@authentication_classes([CachedTokenAuthentication])
 def verify_token(request):
-    token = Token.objects.get(key='b953dd65ca5d05717b8fd195c34fad58aeca1545')
-    print(token.user)
-    return HttpResponse(token.user)
\ No newline at end of file
+    return Response({'username': request.user.username})
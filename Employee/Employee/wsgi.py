@@ -13,4 +13,39 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Employee.settings')
 
-application = get_wsgi_application()
+django_application = get_wsgi_application()
+
+# Imported after setup, they need the app registry
+from django.core.handlers.exception import convert_exception_to_response  # noqa: E402
+from django.core.handlers.wsgi import WSGIHandler  # noqa: E402
+from django.urls import reverse  # noqa: E402
+from rest_framework.authtoken.views import obtain_auth_token  # noqa: E402
+
+# Taken from api_urls.py so the two can't drift apart
+TOKEN_AUTH_PATH = reverse('api-token-auth')
+
+
+class TokenAuthHandler(WSGIHandler):
+    # A WSGIHandler without middleware or URL resolving: every request goes
+    # straight to obtain_auth_token. Signals, request parsing and response
+    # closing are the same as for the main handler.
+
+    def load_middleware(self, is_async=False):
+        self._middleware_chain = convert_exception_to_response(self._get_token_response)
+
+    def _get_token_response(self, request):
+        # CommonMiddleware isn't run, so check the Host header against
+        # ALLOWED_HOSTS here (DisallowedHost becomes a 400 like elsewhere)
+        request.get_host()
+        return obtain_auth_token(request).render()
+
+
+token_auth_wsgi = TokenAuthHandler()
+
+
+def application(environ, start_response):
+    # Clients retry POST /api/token-auth/ aggressively; skip the middleware
+    # stack and the resolver for it. Other methods (405 etc.) go the long way.
+    if environ.get('PATH_INFO') == TOKEN_AUTH_PATH and environ.get('REQUEST_METHOD') == 'POST':
+        return token_auth_wsgi(environ, start_response)
+    return django_application(environ, start_response)
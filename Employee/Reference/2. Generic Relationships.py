@@ -34,6 +34,33 @@ class Comment(models.Model):
     # Additional fields for comments
     text = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+
+    # Copied from the target when the comment is saved, so listings can show "Comment on <title>"
+    # without resolving content_object. Kept up to date by sync_comment_targets below.
+    target_title = models.CharField(max_length=255, blank=True)
+    target_url = models.CharField(max_length=500, blank=True)
+
+    class Meta:
+        # Every lookup by target filters on content_type and object_id; the content_type FK index alone
+        # still reads all comments of that type. The trailing columns also serve the newest-first
+        # keyset pagination below, so a page is read straight from the index in order.
+        # Run makemigrations after adding it.
+        indexes = [
+            models.Index(fields=['content_type', 'object_id', '-created_at', '-id'], name='comment_target_recent_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Reading self.content_object would SELECT the target whenever only content_type_id/object_id
+        # are set. Copy from the target only if it is already loaded (content_object=... was passed),
+        # and load it only when the copied fields are still empty.
+        target = Comment.content_object.get_cached_value(self, None)
+        if target is None and not self.target_title:
+            target = self.content_object
+        if target is not None:
+            self.target_title = str(target)[:255]
+            get_absolute_url = getattr(target, 'get_absolute_url', None)
+            self.target_url = get_absolute_url() if get_absolute_url else ''
+        super().save(*args, **kwargs)
     
 # 2. Define Models to be Commented On
 # Create models that will be related to the Comment model using the generic relation.
@@ -41,13 +68,58 @@ class Comment(models.Model):
 
 # models.py
 
+from django.urls import reverse
+
 class BlogPost(models.Model):
     title = models.CharField(max_length=100)
     body = models.TextField()
 
+    def __str__(self):
+        return self.title
+
+    def get_absolute_url(self):
+        return reverse('blogpost_detail', args=[self.pk])
+
 class Photo(models.Model):
     image = models.ImageField(upload_to='photos/')
     description = models.TextField()
+
+    def __str__(self):
+        return self.description[:50]
+
+    def get_absolute_url(self):
+        return reverse('photo_detail', args=[self.pk])
+
+# ContentType ids of the commentable models. get_for_models() fetches all of them in one query,
+# the dict is built on first use and kept for the life of the process (ContentType ids don't change).
+# Don't do this in AppConfig.ready(), Django warns against database queries there.
+
+from types import MappingProxyType
+
+COMMENTABLE_MODELS = (BlogPost, Photo)
+
+def comment_ct_ids():
+    if not hasattr(Comment, 'CT_CACHE'):
+        content_types = ContentType.objects.get_for_models(*COMMENTABLE_MODELS)
+        # Read-only, callers share this one dict
+        Comment.CT_CACHE = MappingProxyType({model: ct.id for model, ct in content_types.items()})
+    return Comment.CT_CACHE
+
+# signals.py
+# When a target changes, refresh the copied title/url on all of its comments with one UPDATE.
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+@receiver(post_save, sender=BlogPost, dispatch_uid="myapp.sync_comment_targets", weak=False)
+@receiver(post_save, sender=Photo, dispatch_uid="myapp.sync_comment_targets", weak=False)
+def sync_comment_targets(sender, instance, created, **kwargs):
+    if created:
+        return
+    get_absolute_url = getattr(instance, 'get_absolute_url', None)
+    Comment.objects.filter(content_type_id=comment_ct_ids()[sender], object_id=instance.pk).update(
+        target_title=str(instance)[:255],
+        target_url=get_absolute_url() if get_absolute_url else '',
+    )
     
 # 3. Add ContentType and Object ID Fields
 # In the Comment model, the content_type and object_id fields are used to dynamically link the comment to an instance of any model. The GenericForeignKey field (content_object) provides a way to access the related object directly.
@@ -58,29 +130,117 @@ class Photo(models.Model):
 # Creating a Comment:
 
 from django.contrib.contenttypes.models import ContentType
-from myapp.models import BlogPost, Comment
+from myapp.models import BlogPost, Comment, Photo, comment_ct_ids
 
 # Assume you have a BlogPost instance
 blog_post = BlogPost.objects.get(id=1)
 
 # Create a comment for the BlogPost
+# Passing content_object=blog_post also works, but looks up the ContentType for every new comment.
+# The target is already in hand, so pass its copied fields too; save() then doesn't load it again.
+CT_CACHE = comment_ct_ids()
 comment = Comment.objects.create(
-    content_object=blog_post,
-    text="This is a comment on a blog post!"
+    content_type_id=CT_CACHE[type(blog_post)],
+    object_id=blog_post.pk,
+    text="This is a comment on a blog post!",
+    target_title=str(blog_post)[:255],
+    target_url=blog_post.get_absolute_url(),
 )
 
+# Creating many comments at once:
+# one INSERT, with content_type_id taken from the cached dict instead of the content_object assignment.
+# bulk_create() doesn't call save(), so fill in the copied target fields yourself.
+photo = Photo.objects.get(id=1)
+pairs = [(blog_post, "First!"), (photo, "Nice shot")]
+Comment.objects.bulk_create([
+    Comment(
+        content_type_id=CT_CACHE[type(obj)],
+        object_id=obj.pk,
+        text=text,
+        target_title=str(obj)[:255],
+        target_url=obj.get_absolute_url(),
+    )
+    for obj, text in pairs
+])
+
 # Querying Comments:
 
 
-from myapp.models import Comment
+from myapp.models import Comment, comment_ct_ids
 
 # Get comments related to a specific BlogPost instance
+# (a GenericForeignKey can't be used in filter(), so filter on content_type_id and object_id)
 blog_post = BlogPost.objects.get(id=1)
-comments = Comment.objects.filter(content_object=blog_post)
+CT_CACHE = comment_ct_ids()
+comments = Comment.objects.filter(content_type_id=CT_CACHE[BlogPost], object_id=blog_post.pk)
 
 # Get all comments for a specific type
-content_type = ContentType.objects.get_for_model(BlogPost)
-comments = Comment.objects.filter(content_type=content_type, object_id=blog_post.id)
+comments = Comment.objects.filter(content_type_id=CT_CACHE[BlogPost])
+
+# Paginating comments of a popular target:
+# OFFSET still reads and discards every skipped row. Keyset pagination continues after the last
+# row of the previous page, so every page costs the same. Pass the last comment's created_at and id back as the cursor.
+from django.db.models import Q
+
+def comments_page(qs, after_created=None, after_id=None, limit=40):
+    if after_created is not None:
+        qs = qs.filter(Q(created_at__lt=after_created) | Q(created_at=after_created, id__lt=after_id))
+    return list(qs.order_by('-created_at', '-id')[:limit])
+
+page = comments_page(Comment.objects.filter(content_type_id=CT_CACHE[BlogPost], object_id=blog_post.pk))
+if page:
+    next_page = comments_page(
+        Comment.objects.filter(content_type_id=CT_CACHE[BlogPost], object_id=blog_post.pk),
+        after_created=page[-1].created_at, after_id=page[-1].id,
+    )
+
+# Comments across mixed targets with their objects (Django 5.0+):
+# reading comment.content_object in a loop runs one query per comment, GenericPrefetch loads the
+# targets with one query per model instead. Give each model a queryset with only the fields you render.
+from django.contrib.contenttypes.prefetch import GenericPrefetch
+
+comments = Comment.objects.filter(object_id__in=[1, 2, 3]).prefetch_related(
+    GenericPrefetch("content_object", [
+        BlogPost.objects.only("id", "title"),
+        Photo.objects.only("id", "description"),
+    ])
+)
+for comment in comments:
+    print(comment.content_object, comment.text)
+
+# Linking to the target in a comment list: use the copied target_url/target_title rather than
+# {{ comment.content_object.get_absolute_url }}, which needs the target (and a reverse()) per comment.
+# Templates can't pass arguments to methods, so a precomputed value on the row is the way to hand it over.
+
+# html
+# {% for comment in comments %}
+#     <a href="{{ comment.target_url }}">{{ comment.target_title }}</a>: {{ comment.text }}
+# {% endfor %}
+
+# Read-only listing:
+# when only comment columns are rendered (e.g. a JSON endpoint), values() skips building
+# model instances altogether. Only use it when no model methods (like the target's __str__) are needed.
+comments = (Comment.objects
+    .filter(content_type_id=CT_CACHE[BlogPost], object_id__in=[1, 2, 3])
+    .values('text', 'created_at', 'content_type__model', 'object_id', 'target_title', 'target_url'))
+
+# Exports and nightly jobs over many comments:
+# iterating a queryset loads every row into memory first. iterator() streams them instead
+# (a server-side cursor on PostgreSQL), holding one chunk at a time. Django 4.1+ also runs
+# prefetch_related per chunk when chunk_size is given. Behind pgbouncer in transaction mode,
+# set DISABLE_SERVER_SIDE_CURSORS = True on the database.
+import csv
+
+with open('comments.csv', 'w', newline='') as f:
+    writer = csv.writer(f)
+    for comment in Comment.objects.filter(content_type_id=CT_CACHE[BlogPost]).iterator(chunk_size=2000):
+        writer.writerow([comment.object_id, comment.target_title, comment.text, comment.created_at])
+
+# For mixed targets, combine values() with one bulk fetch per ContentType:
+# comments_by_ct = {}
+# for row in Comment.objects.values('content_type_id', 'object_id', 'text'):
+#     comments_by_ct.setdefault(row['content_type_id'], []).append(row)
+# blog_posts = BlogPost.objects.in_bulk([row['object_id'] for row in comments_by_ct.get(CT_CACHE[BlogPost], [])])
 
 # 5. Admin Integration
 # To manage comments in the Django admin interface, you may want to register your model.
@@ -91,7 +251,16 @@ from django.contrib import admin
 from myapp.models import Comment
 
 class CommentAdmin(admin.ModelAdmin):
-    list_display = ('content_type', 'object_id', 'text', 'created_at')
+    # target_title instead of content_object: the targets don't have to be loaded at all
+    list_display = ('content_type', 'object_id', 'target_title', 'text', 'created_at')
+
+    def get_queryset(self, request):
+        # content_type is shown for every row, join it;
+        # only() limits the SELECT to the columns the change list shows
+        return super().get_queryset(request).select_related('content_type').only(
+            'id', 'object_id', 'target_title', 'text', 'created_at',
+            'content_type__app_label', 'content_type__model',
+        )
 
 admin.site.register(Comment, CommentAdmin)
 
@@ -33,6 +33,32 @@ MIDDLEWARE = [
 # bash
 # Copy code
 # python manage.py migrate
+
+# PostgreSQL: Trigram Index on the URL
+# Serving a flatpage looks it up with url = '...', which the existing index on url already covers.
+# Substring searches on url (icontains, the admin search box) can't use that index and scan the
+# whole table; a pg_trgm GIN index covers them. Put the migration in one of your own apps
+# (e.g. myapp/migrations/0002_flatpage_url_trgm.py), since django.contrib.flatpages' migrations can't be edited.
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('flatpages', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY flatpage_url_trgm ON django_flatpage USING gin (url gin_trgm_ops);",
+            reverse_sql="DROP INDEX CONCURRENTLY flatpage_url_trgm;",
+        ),
+    ]
+
 # 2. Create Flatpages
 # Use the Admin Interface
 
@@ -70,6 +96,56 @@ urlpatterns = [
     path('pages/', include('django.contrib.flatpages.urls')),
 ]
 
+# Caching Rendered Flatpages
+# Every flatpage hit runs a query and renders the template. The content only changes when a flatpage
+# is edited, so cache the rendered page and route flatpages through this view instead.
+# Keys carry a version that is bumped on every FlatPage change, which also covers changed urls and
+# sites (deleting single keys would leave the old url cached).
+
+# flatpages_cache.py
+import time
+
+from django.contrib.flatpages.models import FlatPage
+from django.contrib.flatpages.views import flatpage
+from django.contrib.sites.shortcuts import get_current_site
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.http import HttpResponse
+
+FLATPAGE_CACHE_TIMEOUT = 3600  # seconds
+VERSION_KEY = 'fp:version'
+
+def _key(version, site_id, authed, url):
+    return f"fp:{version}:{site_id}:{int(authed)}:{url}"
+
+def cached_flatpage(request, url):
+    # Seeded from the clock like the bumps below: a lost version key must not fall back to a value
+    # that old pages were cached under
+    version = cache.get_or_set(VERSION_KEY, time.time_ns, None)
+    key = _key(version, get_current_site(request).id, request.user.is_authenticated, url)
+    content = cache.get(key)
+    if content is None:
+        response = flatpage(request, url)
+        if response.status_code != 200:  # e.g. the redirect that adds a trailing slash
+            return response
+        content = response.content
+        cache.set(key, content, FLATPAGE_CACHE_TIMEOUT)
+    return HttpResponse(content)
+
+@receiver([post_save, post_delete], sender=FlatPage, dispatch_uid="flatpages_cache.invalidate_flatpages", weak=False)
+@receiver(m2m_changed, sender=FlatPage.sites.through, dispatch_uid="flatpages_cache.invalidate_flatpages", weak=False)
+def invalidate_flatpages(sender, **kwargs):
+    cache.set(VERSION_KEY, time.time_ns(), None)
+
+# urls.py
+from django.urls import path
+from .flatpages_cache import cached_flatpage
+
+urlpatterns = [
+    path('pages/<path:url>', cached_flatpage),
+]
+
 # 4. Customizing Flatpage Templates
 # You may want to customize how flatpages are rendered. To do this, create a template that matches the flatpage’s template_name:
 
@@ -112,6 +188,28 @@ urlpatterns = [
 
 # View and Edit Existing Flatpages: Manage flatpages through the admin interface.
 # Search and Filter Flatpages: Find specific flatpages by title or URL.
+
+# Showing the sites of each flatpage in the list: reading flatpage.sites.all() per row runs one query per
+# flatpage, prefetch them for the whole page instead (two queries in total).
+
+# admin.py
+from django.contrib import admin
+from django.contrib.flatpages.admin import FlatPageAdmin
+from django.contrib.flatpages.models import FlatPage
+
+class SiteFlatPageAdmin(FlatPageAdmin):
+    list_display = ('url', 'title', 'site_names')
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related('sites')
+
+    @admin.display(description='Sites')
+    def site_names(self, obj):
+        # .all() reads the prefetched sites, filtering or ordering here would query again
+        return ', '.join(site.domain for site in obj.sites.all())
+
+admin.site.unregister(FlatPage)
+admin.site.register(FlatPage, SiteFlatPageAdmin)
 # Summary
 # Django Flatpages provide a simple way to manage static content within your Django project. Here's a recap of what you need to do:
 
@@ -44,6 +44,31 @@ def my_view(request, id):
 
 # In this case, my_named_url should be a URL pattern that accepts parameters.
 
+# Reversing Once Instead of Per Request
+# reverse() looks the name up and rebuilds the URL on every call. For a fixed URL used as a class
+# attribute, reverse_lazy() defers the lookup until first use (urls.py may not be loaded yet at import time):
+
+from django.urls import reverse_lazy
+from django.views.generic.base import RedirectView
+
+class MyRedirectView(RedirectView):
+    url = reverse_lazy('my_named_url')
+
+# For parameterized URLs in hot views, memoize reverse() per (name, args). args must be a tuple.
+# Only do this when the site is served under a single script prefix and the urlconf doesn't
+# change per request, the cached URLs would be wrong otherwise.
+
+from functools import lru_cache
+from django.shortcuts import redirect
+from django.urls import reverse
+
+@lru_cache(maxsize=1024)
+def _cached_reverse(name, args=()):
+    return reverse(name, args=args)
+
+def my_view(request, id):
+    return redirect(_cached_reverse('my_named_url', (id,)))
+
 # 2. Redirects in Class-Based Views
 # Django’s class-based views provide several mixins and methods for handling redirects.
 
@@ -103,6 +128,29 @@ def my_form_view(request):
         form = MyForm()
     return render(request, 'my_template.html', {'form': form})
 
+# For formsets, formset.save() runs one INSERT/UPDATE per form, each in its own transaction.
+# Save the changed rows in bulk inside one transaction instead. Note that bulk_create/bulk_update
+# don't call the model's save() or send pre_save/post_save.
+
+from django.db import transaction
+from django.shortcuts import render, redirect
+from .forms import MyModelFormSet
+from .models import MyModel
+
+def my_formset_view(request):
+    formset = MyModelFormSet(request.POST or None)
+    if request.method == 'POST' and formset.is_valid():
+        instances = formset.save(commit=False)  # only new and changed forms
+        to_create = [obj for obj in instances if obj.pk is None]
+        to_update = [obj for obj in instances if obj.pk is not None]
+        with transaction.atomic():
+            MyModel.objects.bulk_create(to_create)
+            MyModel.objects.bulk_update(to_update, ['field_a', 'field_b'])
+            for obj in formset.deleted_objects:
+                obj.delete()
+        return redirect('success_url')
+    return render(request, 'my_template.html', {'formset': formset})
+
 
 # 4. Using Django’s redirect Shortcut
 # The redirect function can handle different types of redirection, such as:
@@ -113,7 +161,20 @@ def my_form_view(request):
 # 5. Handling Redirects in Middleware
 # If you need to handle redirects globally, you can use middleware. For example, you might redirect all HTTP to HTTPS or handle URL rewrites.
 
+# HTTP to HTTPS:
+# Don't write middleware for this, SecurityMiddleware already does it (one is_secure() check per request).
+
+# settings.py
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    # ...
+]
+SECURE_SSL_REDIRECT = True
+SECURE_REDIRECT_EXEMPT = [r'^healthz/$']  # regexes matched against the path without the leading slash
+
 # Example Middleware:
+# For other global redirects write your own. Build the target url directly from the host and path
+# instead of build_absolute_uri() followed by a string replace.
 
 
 from django.http import HttpResponsePermanentRedirect
@@ -124,11 +185,8 @@ class RedirectToHTTPSMiddleware:
 
     def __call__(self, request):
         if not request.is_secure():
-            url = request.build_absolute_uri(request.get_full_path())
-            https_url = url.replace('http://', 'https://')
-            return HttpResponsePermanentRedirect(https_url)
-        response = self.get_response(request)
-        return response
+            return HttpResponsePermanentRedirect(f"https://{request.get_host()}{request.get_full_path()}")
+        return self.get_response(request)
     
 # 6. Handling Redirects in Templates
 # You can use Django’s {% url %} template tag to create links that redirect users.
@@ -35,24 +35,44 @@
 # Example:
 
 
+from django.db import transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from django.core.mail import send_mail
 from .models import MyModel
+from .tasks import send_new_instance_email
 
-@receiver(post_save, sender=MyModel)
+@receiver(post_save, sender=MyModel, dispatch_uid="myapp.my_model_post_save", weak=False)
 def my_model_post_save(sender, instance, created, **kwargs):
     if created:
-        # Send an email after a new instance is created
-        send_mail(
-            'New Instance Created',
-            f'A new instance of {sender.__name__} has been created.',
-            'from@example.com',
-            ['to@example.com'],
-            fail_silently=False,
-        )
+        # Send an email after a new instance is created.
+        # Queued once the transaction commits, so the worker can see the row and a rollback sends nothing.
+        transaction.on_commit(lambda: send_new_instance_email.delay(instance.pk))
+
+
+# tasks.py (Celery with a Redis broker, see "18. Celery" for the setup)
+
+from celery import shared_task
+from django.core.mail import send_mail
+from .models import MyModel
+
+@shared_task
+def send_new_instance_email(pk):
+    instance = MyModel.objects.get(pk=pk)
+    send_mail(
+        'New Instance Created',
+        f'A new instance of {type(instance).__name__} has been created.',
+        'from@example.com',
+        ['to@example.com'],
+        fail_silently=False,
+    )
         
 # In this example, my_model_post_save is a receiver function that sends an email whenever a new instance of MyModel is created.
+# Receivers run inside save(), so sending the mail directly would keep the request waiting on the SMTP server;
+# the Celery worker sends it instead.
+# dispatch_uid makes connecting idempotent: if the signals module is imported twice (e.g. under two module paths),
+# the receiver is still connected once instead of running twice per save.
+# weak=False stores a plain reference instead of a weakref that has to be resolved on every send();
+# module-level functions live as long as the process anyway.
 
 # 2. Connect the Receiver to the Signal
 # You can connect the receiver to the signal using the @receiver decorator as shown above, or by using the signal.connect() method.
@@ -68,7 +88,7 @@ def my_model_post_save(sender, instance, created, **kwargs):
         # Your logic here
         pass
 
-post_save.connect(my_model_post_save, sender=MyModel)
+post_save.connect(my_model_post_save, sender=MyModel, dispatch_uid="myapp.my_model_post_save", weak=False)
 
 
 # 3. Ensure Signal Handlers are Loaded
@@ -132,7 +152,7 @@ def my_custom_receiver(sender, **kwargs):
     print('Custom signal received')
 
 # Connect the receiver to the custom signal
-my_custom_signal.connect(my_custom_receiver)
+my_custom_signal.connect(my_custom_receiver, dispatch_uid="myapp.my_custom_receiver", weak=False)
 
 # Send the signal
 my_custom_signal.send(sender='my_sender')
@@ -186,6 +186,23 @@ def my_logout_view(request):
 if request.user.has_perm('myapp.can_view'):
     pass
     # User has permission
+
+# The first has_perm() call loads all of the user's permissions (user and group) and caches them
+# on the user object, later checks in the same request are set lookups. Check several at once with has_perms():
+if request.user.has_perms(['myapp.can_view', 'myapp.change_mymodel']):
+    pass
+
+# Per-object permissions (django-guardian): don't call has_perm(perm, obj) in a loop over a list,
+# each call queries the permission tables. Prefetch them for the whole list in one go:
+from guardian.core import ObjectPermissionChecker
+from guardian.shortcuts import get_objects_for_user
+
+checker = ObjectPermissionChecker(request.user)
+checker.prefetch_perms(objects)
+visible = [obj for obj in objects if checker.has_perm('myapp.can_view', obj)]
+
+# or let the database filter them:
+visible = get_objects_for_user(request.user, 'myapp.can_view', klass=MyModel)
 # Assigning Permissions:
 
 # Permissions can be assigned through Django’s admin interface or programmatically.
@@ -197,6 +214,8 @@ from django.contrib.auth.models import Permission
 
 permission = Permission.objects.get(codename='can_view')
 user.user_permissions.add(permission)
+# The permission cache on this user object is now stale, reload the user before checking again
+user = User.objects.get(pk=user.pk)
 
 # Custom Permissions:
 
@@ -230,10 +249,32 @@ user.groups.add(group)
 # Password Hashing:
 
 # Django handles password hashing securely by default. You don’t need to manage password hashes manually.
+# The hash only runs in authenticate() (login, password change). After login() every request is
+# authenticated from the session, without hashing.
+
+# The default PBKDF2 hasher is deliberately slow, roughly a few hundred ms of CPU per login. Argon2 is
+# the hasher recommended by Django; it is memory-hard and usually costs less CPU per login at its default
+# settings. Needs pip install argon2-cffi. Existing PBKDF2 hashes keep working and are upgraded on the next login.
+
+# settings.py
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
+# Tests that create users or log in (e.g. in setUp) spend most of their time hashing. Use a fast,
+# insecure hasher in the test settings only:
+# PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# With an email login (USERNAME_FIELD = 'email'), make email unique=True as in the CustomUser example
+# above; that also gives it the index authenticate() looks users up with.
 
 # Changing Passwords:
 
 # You can use the built-in views for password change and reset, as shown earlier.
+# In your own password change view call update_session_auth_hash(request, user) after saving,
+# otherwise the user's session is invalidated and they have to log in (and hash) again.
 
 # Password Reset:
 
@@ -271,6 +312,11 @@ from django.contrib.auth.models import User
 class UserProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     bio = models.TextField(blank=True)
+
+    @classmethod
+    def bulk_sync(cls, users):
+        # One INSERT for all users; users that already have a profile are skipped
+        cls.objects.bulk_create([cls(user=user) for user in users], ignore_conflicts=True)
     
 # Creating and Saving User Profiles:
 
@@ -279,15 +325,24 @@ class UserProfile(models.Model):
 # Example:
 
 # signals.py
+from django.db import transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import User
 from .models import UserProfile
 
-@receiver(post_save, sender=User)
+@receiver(post_save, sender=User, dispatch_uid="myapp.create_user_profile", weak=False)
 def create_user_profile(sender, instance, created, **kwargs):
-    if created:
-        UserProfile.objects.create(user=instance)
+    if not created:
+        return
+    # Runs once the user's transaction has committed (immediately outside a transaction);
+    # get_or_create in case the profile was already created in the same transaction.
+    transaction.on_commit(lambda: UserProfile.objects.get_or_create(user=instance))
+
+# User.objects.bulk_create() doesn't send post_save, so bulk imports have to create the profiles
+# themselves, in one query:
+# users = User.objects.bulk_create(new_users)
+# UserProfile.bulk_sync(users)
         
         
 # Connect Signals:
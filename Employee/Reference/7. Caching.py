@@ -14,6 +14,8 @@
 
 # 1. In-Memory Caching
 # The simplest caching backend, suitable for development and small-scale deployments.
+# Each process has its own cache: with several gunicorn/uvicorn workers every worker misses separately
+# and cache.delete() only clears the worker that ran it. Use Redis or Memcached in production.
 
 
 # settings.py
@@ -65,13 +67,39 @@ CACHES = {
 
 
 # 4. Redis
-# Redis is a popular, fast, and flexible caching backend.
+# Redis is a popular, fast, and flexible caching backend, shared by all workers and servers.
+# The built-in backend (Django 4.0+) keeps a connection pool per process; remaining OPTIONS are passed
+# to redis-py's ConnectionPool. Values are pickled with pickle.HIGHEST_PROTOCOL (5 on Python 3.8+).
+# max_connections on the default pool is a hard cap: one connection too many raises "Too many connections".
+# With BlockingConnectionPool the request waits up to timeout seconds for a free connection instead.
 
 # settings.py
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.redis.RedisCache',
         'LOCATION': 'redis://127.0.0.1:6379/1',
+        'OPTIONS': {
+            'pool_class': 'redis.BlockingConnectionPool',
+            'max_connections': 100,
+            'timeout': 5,
+        },
+    }
+}
+
+# django-redis (pip install django-redis) has more options, e.g. compressing large values with zstd
+# (pip install pyzstd). Its options only work with its own backend, not with the built-in one.
+
+# settings.py
+CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': 'redis://127.0.0.1:6379/1',
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'CONNECTION_POOL_KWARGS': {'max_connections': 100},
+            'PICKLE_VERSION': 5,
+            'COMPRESSOR': 'django_redis.compressors.zstd.ZStdCompressor',
+        },
     }
 }
 
@@ -153,6 +181,21 @@ def my_view(request):
     
     return response
 
+# In async views (served by an ASGI server such as Daphne or Uvicorn, with ASGI_APPLICATION set), use the
+# a-prefixed cache methods. A plain cache.get() there would block the event loop while waiting for Redis.
+# The built-in backends implement aget()/aset() by running the sync call in a thread, so they don't make
+# the lookup itself faster, they let other requests run in the meantime.
+
+async def my_async_view(request):
+    cache_key = 'my_view_cache_key'
+    response = await cache.aget(cache_key)
+
+    if response is None:
+        response = render(request, 'my_template.html', {})
+        await cache.aset(cache_key, response, timeout=60*15)
+
+    return response
+
 # Best Practices
 # Cache Invalidations: Ensure that your cache invalidates or updates correctly when the underlying data changes.
 # Cache Size: Monitor and manage cache size to avoid using excessive memory or storage.
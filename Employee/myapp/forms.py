@@ -1,4 +1,13 @@
 from django import forms  
+from myapp.models import Employee
+
+
+class EmployeeForm(forms.ModelForm):
+    class Meta:
+        model = Employee
+        fields = ['EmpId', 'EmpName', 'EmpGender', 'EmpEmail', 'EmpDesignation']
+
+
 class StudentForm(forms.Form):  
     firstname = forms.CharField(label="Enter first name",max_length=50)  
     lastname  = forms.CharField(label="Enter last name", max_length = 10)  
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0006_csestudents'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='csestudents',
+            name='email',
+            field=models.CharField(db_index=True, max_length=200),
+        ),
+        migrations.AlterField(
+            model_name='employee',
+            name='EmpId',
+            field=models.CharField(max_length=5, unique=True),
+        ),
+    ]
@@ -3,7 +3,7 @@ from django.db import models
 # Create your models here.
 
 class Employee(models.Model):
-    EmpId = models.CharField(max_length=5)
+    EmpId = models.CharField(max_length=5, unique=True)
     EmpName = models.CharField(max_length=200)
     EmpGender = models.CharField(max_length=10)
     EmpEmail = models.EmailField()
@@ -22,7 +22,7 @@ class EceStudents(models.Model):
 class CseStudents(models.Model):
     name = models.CharField(max_length=100)
     age =  models.IntegerField()
-    email = models.CharField(max_length=200)
+    email = models.CharField(max_length=200, db_index=True)
     pass_word = models.CharField(max_length=200)
     class Meta:
         db_table="CseStudents"
\ No newline at end of file
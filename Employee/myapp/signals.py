@@ -0,0 +1,32 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Employee
+
+EMPLOYEE_REVISION_KEY = 'emp:revision'
+
+
+def employee_revision():
+    # Part of every cached employee page key; changing it orphans them all.
+    # Seeded from the clock so a lost key can't bring back an old revision.
+    return cache.get_or_set(EMPLOYEE_REVISION_KEY, time.time_ns, None)
+
+
+@receiver([post_save, post_delete], sender=Employee, dispatch_uid='myapp.employee_revision_bump')
+def bump_employee_revision(sender, **kwargs):
+    # Both signals fire before COMMIT (delete() always runs in a transaction).
+    # Bumping then would let a concurrent show_emp cache the old rows under
+    # the new revision, so wait until the change is visible.
+    transaction.on_commit(_bump_employee_revision)
+
+
+def _bump_employee_revision():
+    try:
+        cache.incr(EMPLOYEE_REVISION_KEY)
+    except ValueError:
+        # Not set yet or evicted
+        cache.set(EMPLOYEE_REVISION_KEY, time.time_ns(), None)
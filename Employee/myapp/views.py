@@ -1,8 +1,18 @@
-from django.shortcuts import render, redirect
-from django.http import HttpResponse
+import csv
+import itertools
+import os
+import shutil
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.move import file_move_safe
+from django.core.paginator import Paginator
+from django.db import connection, transaction
+from django.shortcuts import get_object_or_404, render, redirect
+from django.http import HttpResponse, StreamingHttpResponse
 from .models import Employee, EceStudents, CseStudents
-from myapp.forms import StudentForm
-import pandas as pd
+from myapp.forms import EmployeeForm, StudentForm
+from .signals import employee_revision
 
 # Create your views here.
 
@@ -16,40 +26,56 @@ def index(request):
 
 def insert_emp(request):
     if request.method == "POST":
-        EmpId = request.POST['EmpId']
-        EmpName = request.POST['EmpName']
-        EmpGender = request.POST['EmpGender']
-        EmpEmail = request.POST['EmpEmail']
-        EmpDesignation = request.POST['EmpDesignation']
-        data = Employee(EmpId=EmpId, EmpName=EmpName, EmpGender=EmpGender, EmpEmail=EmpEmail, EmpDesignation= EmpDesignation)
-        data.save()
-  
-        return redirect('show/')
+        form = EmployeeForm(request.POST)
+        if form.is_valid():
+            form.save()
+            return redirect('show-emp')
     else:
-        return render(request, 'insert.html')
+        form = EmployeeForm()
+    return render(request, 'insert.html', {'form': form})
 
 # Retrive Employee
-        
+
+SHOW_EMP_CACHE_TIMEOUT = 60 * 60
+
+
 def show_emp(request):
-    employees = Employee.objects.all()
-    return render(request,'show.html',{'employees':employees} )
+    # Rendered pages are cached under the current employee revision. Any
+    # Employee save/delete bumps it (signals.py), so old pages are never
+    # read again and expire on their own; nothing has to be deleted.
+    revision = employee_revision()
+    page = request.GET.get('page', '')
+    # Only plain page numbers reach the cache key: 'abc', '' or absurdly long
+    # numbers mean page 1, and '01' shares the entry of '1'.
+    number = int(page) if page.isdecimal() and len(page) <= 9 else 1
+    content = cache.get('emp:list:v%s:p%s' % (revision, number))
+    if content is None:
+        # One page of employees per request instead of the whole table
+        paginator = Paginator(Employee.objects.order_by('id'), 50)
+        page_obj = paginator.get_page(number)
+        # Stored under the page actually shown, so out-of-range numbers
+        # (get_page() falls back to the last page) don't add entries.
+        content = render(request,'show.html',{'page_obj':page_obj} ).content
+        cache.set('emp:list:v%s:p%s' % (revision, page_obj.number), content, SHOW_EMP_CACHE_TIMEOUT)
+    return HttpResponse(content)
 
 
 # Update Employee
 
 def edit_emp(request,pk):
-    employees = Employee.objects.get(id=pk)
+    employees = get_object_or_404(Employee, pk=pk)
     if request.method == 'POST':
-        employees.EmpId = request.POST['EmpId']
-        employees.EmpName = request.POST['EmpName']
-        employees.EmpGender = request.POST['EmpGender']
-        employees.EmpEmail = request.POST['EmpEmail']
-        employees.EmpDesignation = request.POST['EmpDesignation']
-        employees.save()
-        return redirect('/show')
+        form = EmployeeForm(request.POST, instance=employees)
+        if form.is_valid():
+            # UPDATE only the columns that were edited; nothing at all if none were
+            form.save(commit=False).save(update_fields=form.changed_data)
+            return redirect('show-emp')
+    else:
+        form = EmployeeForm(instance=employees)
 
     context = {
         'employees': employees,
+        'form': form,
     }
 
     return render(request,'edit.html',context)
@@ -57,11 +83,11 @@ def edit_emp(request,pk):
 # Delete Employee
 
 def remove_emp(request, pk):
-    employees = Employee.objects.get(id=pk)
+    employees = get_object_or_404(Employee, pk=pk)
 
     if request.method == 'POST':
         employees.delete()
-        return redirect('/show')
+        return redirect('show-emp')
 
     context = {
         'employees': employees,
@@ -83,71 +109,60 @@ def upload_files(request):
 
 
 def handle_uploaded_file(f):  
-    with open('myapp/static/upload/'+f.name, 'wb+') as destination:  
-        for chunk in f.chunks():  
-            destination.write(chunk)
+    # basename() keeps a crafted file name from writing outside upload/
+    path = os.path.join('myapp/static/upload/', os.path.basename(f.name))
+    if hasattr(f, 'temporary_file_path'):
+        # Already on disk (TemporaryFileUploadHandler): move it, no bytes copied
+        file_move_safe(f.temporary_file_path(), path, allow_overwrite=True)
+        # Temporary files are created 0600
+        if settings.FILE_UPLOAD_PERMISSIONS is not None:
+            os.chmod(path, settings.FILE_UPLOAD_PERMISSIONS)
+        return
+    with open(path, 'wb') as destination:  
+        # Copied in 1 MiB blocks by shutil instead of a Python loop over chunks()
+        shutil.copyfileobj(f, destination, length=1 << 20)
 
 
 def read_csv_file(request):
-    import pandas as pd 
-    df=pd.read_csv("myapp/static/upload/data.csv")
-
-    print(df)
-
-    print(len(df.Name)) # count number of rows
-
-    name_list = list(df.Name)
-    age_list = list(df.Age)
-    email_list = list(df.Email)
-    password_list = list(df.Password)
+    # COPY streams the file into the table in one statement, without an
+    # INSERT to parse per row or batch. The CSV columns (Name, Age, Email,
+    # Password) are in table column order, only the header is skipped.
+    # Cursors without copy_expert (psycopg 3, SQLite in development) get one
+    # parameterized INSERT run for all rows with executemany().
+    quote_name = connection.ops.quote_name
+    table = quote_name(CseStudents._meta.db_table)
+    columns = ', '.join(quote_name(column) for column in ('name', 'age', 'email', 'pass_word'))
+    with open("myapp/static/upload/data.csv", newline='') as f, transaction.atomic():
+        with connection.cursor() as cursor:
+            if hasattr(cursor, 'copy_expert'):
+                cursor.copy_expert(
+                    "COPY %s (%s) FROM STDIN WITH (FORMAT csv, HEADER true)" % (table, columns), f,
+                )
+            else:
+                reader = csv.reader(f)
+                next(reader, None)  # header
+                cursor.executemany(
+                    "INSERT INTO %s (%s) VALUES (%%s, %%s, %%s, %%s)" % (table, columns),
+                    ((name, int(age), email, password) for name, age, email, password in reader),
+                )
 
-    for index in range(0, len(name_list)):
-
-        print(name_list[index])
-        print(age_list[index])
-        print(email_list[index])
-        print(password_list[index])
+    return render(request,"csv_data.html")
 
-        cs_stds = CseStudents(name=name_list[index], age=age_list[index], email=email_list[index], pass_word=password_list[index])
-        cs_stds.save()
+class Echo:
+    # File-like object for csv.writer that hands each row back instead of storing it
+    def write(self, value):
+        return value
 
-    return render(request,"csv_data.html")
 
 def write_into_csv_file(request):
-    # We need to fetch db details as columns wise first
-    db_details =  CseStudents.objects.all().order_by('name').values()
-    print(type(db_details))
-    dict_of_csv_data = {
-        'name':None,
-        'age':None,
-        'email':None,
-        'pass_word':None
-    }
-    id_list = []
-    name_list = []
-    age_list = []
-    email_list = []
-    pass_word_list = []
-
-    for index in range(0, len(db_details)): # for number of rows
-        # Store in a list to add in dictionary to change it into csv file
-        name_list.append(db_details[index].get('name'))
-        age_list.append(db_details[index].get('age'))
-        email_list.append(db_details[index].get('email'))
-        pass_word_list.append(db_details[index].get('pass_word'))
-    
-    # Update columns details in dict
-    dict_of_csv_data['name'] = name_list
-    dict_of_csv_data['age'] = age_list
-    dict_of_csv_data['email'] = email_list
-    dict_of_csv_data['pass_word'] = pass_word_list
-    print(dict_of_csv_data)
-
-    # Convert into Dataframe object
-    df = pd.DataFrame(dict_of_csv_data)
-    print(df)
-    # saving in csv file
-    df.to_csv('myapp/static/upload/file1.csv')
-
-    return HttpResponse("Success")
-    
+    # Streamed straight from a server-side cursor, only one chunk of rows
+    # is held in memory and the first bytes go out before the query ends
+    columns = ['name', 'age', 'email', 'pass_word']
+    rows = CseStudents.objects.order_by('name').values_list(*columns).iterator(chunk_size=2000)
+    writer = csv.writer(Echo())
+    response = StreamingHttpResponse(
+        (writer.writerow(row) for row in itertools.chain([columns], rows)),
+        content_type='text/csv',
+    )
+    response['Content-Disposition'] = 'attachment; filename="file1.csv"'
+    return response
@@ -1,9 +1,18 @@
 from django.db import models
 
 # Create your models here.
+class AuthorManager(models.Manager):
+    def with_books(self):
+        # For listing authors with their books: one extra query for all
+        # books instead of one per author. Not the default, most Author
+        # lookups never touch books.
+        return self.get_queryset().prefetch_related('books')
+
 class Author(models.Model):
     name = models.CharField(max_length=100)
 
+    objects = AuthorManager()
+
     def __str__(self):
         return self.name
 
@@ -13,11 +22,19 @@ class Publisher(models.Model):
     def __str__(self):
         return self.name
 
+class BookManager(models.Manager):
+    def get_queryset(self):
+        # Books are almost always shown with their author and publisher;
+        # join them instead of fetching each one per book
+        return super().get_queryset().select_related('author', 'publisher')
+
 class Book(models.Model):
     title = models.CharField(max_length=100)
     author = models.ForeignKey(Author, on_delete=models.CASCADE, related_name='books')
     publisher = models.ForeignKey(Publisher, on_delete=models.CASCADE, related_name='books')
 
+    objects = BookManager()
+
     def __str__(self):
         return self.title
 
@@ -1,3 +1,14 @@
-from django.test import TestCase
+from django.middleware.common import CommonMiddleware
+from django.test import RequestFactory, SimpleTestCase
+from django.urls import resolve
 
 # Create your tests here.
+
+
+class TutorialUrlsTests(SimpleTestCase):
+
+    def test_resolves_without_slash_redirect(self):
+        self.assertEqual(resolve('/tutorial/hello').url_name, 'hello')
+        request = RequestFactory().get('/tutorial/hello')
+        middleware = CommonMiddleware(lambda request: None)
+        self.assertFalse(middleware.should_redirect_with_slash(request))